@@ -1,3 +1,4 @@
+import numpy as np
 from presidio_image_redactor.entities import ImageRecognizerResult
 from typing import List, Tuple, Dict, Union
 
@@ -136,6 +137,23 @@ class BboxProcessor:
 
         return bboxes
 
+    @staticmethod
+    def get_bbox_coordinate_arrays(
+        bboxes: List[Dict[str, Union[str, float, int]]],
+    ) -> Dict[str, np.ndarray]:
+        """Organize bounding box coordinates as one integer array per field.
+
+        :param bboxes: Bounding box info per word (e.g., with padding removed).
+
+        :return: Arrays of left, top, width and height values (in bboxes order).
+        """
+        return {
+            field: np.fromiter(
+                (bbox[field] for bbox in bboxes), dtype=np.int64, count=len(bboxes)
+            )
+            for field in ["left", "top", "width", "height"]
+        }
+
     @staticmethod
     def match_with_source(
         all_pos: List[Dict[str, Union[str, int, float]]],
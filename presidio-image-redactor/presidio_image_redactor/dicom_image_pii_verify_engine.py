@@ -1,5 +1,4 @@
 from copy import deepcopy
-import tempfile
 import PIL
 from PIL import Image
 import pydicom
@@ -80,16 +79,11 @@ class DicomImagePiiVerifyEngine(ImagePiiVerifyEngine, DicomImageRedactorEngine):
         except AttributeError:
             raise AttributeError("Provided DICOM instance lacks pixel data.")
 
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            is_greyscale = self._check_if_greyscale(instance_copy)
-            image = self._rescale_dcm_pixel_array(instance_copy, is_greyscale)
-            self._save_pixel_array_as_png(image, is_greyscale, "tmp_dcm", tmpdirname)
-
-            png_filepath = f"{tmpdirname}/tmp_dcm.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+        # Convert DICOM to PIL image and add padding for OCR (during analysis)
+        is_greyscale = self._check_if_greyscale(instance_copy)
+        image = self._rescale_dcm_pixel_array(instance_copy, is_greyscale)
+        loaded_image = Image.fromarray(image)
+        image = self._add_padding(loaded_image, is_greyscale, padding_width)
 
         # Get OCR results
         perform_ocr_kwargs, ocr_threshold = self.image_analyzer_engine._parse_ocr_kwargs(ocr_kwargs)  # noqa: E501
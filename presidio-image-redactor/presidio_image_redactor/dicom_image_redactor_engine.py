@@ -1,23 +1,85 @@
 import os
-import uuid
 import shutil
-from copy import deepcopy
-import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from copy import copy, deepcopy
 from pathlib import Path
-from PIL import Image, ImageOps
+from PIL import Image
 import pydicom
 from pydicom.pixel_data_handlers.util import apply_voi_lut
-import png
 import json
 import numpy as np
 from matplotlib import pyplot as plt  # necessary import for PIL typing # noqa: F401
 from typing import Tuple, List, Dict, Union, Optional
 
-from presidio_image_redactor import ImageRedactorEngine
+from presidio_image_redactor import ImageRedactorEngine, BboxProcessor
 from presidio_image_redactor import ImageAnalyzerEngine  # noqa: F401
 from presidio_analyzer import PatternRecognizer
 from presidio_image_redactor.entities import ImageRecognizerResult
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _fill_bboxes_kernel(
+    pixels: np.ndarray,
+    tops: np.ndarray,
+    lefts: np.ndarray,
+    heights: np.ndarray,
+    widths: np.ndarray,
+    color: np.ndarray,
+) -> None:
+    """Fill bounding boxes on a pixel array with a color (in place).
+
+    :param pixels: Pixel array viewed as (rows, columns, samples).
+    :param tops: Top coordinate per bounding box.
+    :param lefts: Left coordinate per bounding box.
+    :param heights: Height per bounding box.
+    :param widths: Width per bounding box.
+    :param color: Color value per sample.
+    """
+    rows = pixels.shape[0]
+    columns = pixels.shape[1]
+    for k in range(tops.shape[0]):
+        # Clip the bounding box to the pixel array
+        top = min(max(tops[k], 0), rows)
+        left = min(max(lefts[k], 0), columns)
+        bottom = min(max(tops[k] + heights[k], top), rows)
+        right = min(max(lefts[k] + widths[k], left), columns)
+        for i in range(top, bottom):
+            for j in range(left, right):
+                for c in range(color.shape[0]):
+                    pixels[i, j, c] = color[c]
+
+
+if njit is not None:
+    _fill_bboxes_kernel = njit(cache=True)(_fill_bboxes_kernel)
+
+# Redaction function of a worker process (set once per worker)
+_worker_redact_single_dicom_image = None
+
+
+def _init_redaction_worker(redact_single_dicom_image: partial) -> None:
+    """Store the redaction function (and engine) once in a worker process.
+
+    :param redact_single_dicom_image: Redaction function taking a DICOM path.
+    """
+    global _worker_redact_single_dicom_image
+    _worker_redact_single_dicom_image = redact_single_dicom_image
+
+
+def _redact_in_worker(dcm_path: Path) -> str:
+    """Redact a single DICOM file in a worker process.
+
+    :param dcm_path: Path to the DICOM file.
+
+    :return: Path to the output DICOM file.
+    """
+    return _worker_redact_single_dicom_image(dcm_path)
+
 
 class DicomImageRedactorEngine(ImageRedactorEngine):
     """Performs OCR + PII detection + bounding box redaction.
@@ -70,17 +132,11 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         instance = deepcopy(image)
 
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            is_greyscale = self._check_if_greyscale(instance)
-            image = self._rescale_dcm_pixel_array(instance, is_greyscale)
-            image_name = str(uuid.uuid4())
-            self._save_pixel_array_as_png(image, is_greyscale, image_name, tmpdirname)
-
-            png_filepath = f"{tmpdirname}/{image_name}.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+        # Convert DICOM to PIL image and add padding for OCR (during analysis)
+        is_greyscale = self._check_if_greyscale(instance)
+        rescaled_pixels = self._rescale_dcm_pixel_array(instance, is_greyscale)
+        loaded_image = Image.fromarray(rescaled_pixels)
+        image = self._add_padding(loaded_image, is_greyscale, padding_width)
 
         # Detect PII
         analyzer_results = self._get_analyzer_results(
@@ -97,7 +153,14 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             analyzer_results
         )
         bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
-        redacted_image = self._add_redact_box(instance, bboxes, crop_ratio, fill)
+        redacted_image = self._add_redact_box(
+            instance,
+            bboxes,
+            crop_ratio,
+            fill,
+            rescaled_pixels=rescaled_pixels,
+            is_greyscale=is_greyscale,
+        )
 
         return redacted_image, bboxes
 
@@ -186,7 +249,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             )
 
         # Create duplicate
-        dst_path = self._copy_files_for_processing(input_dicom_path, output_dir)
+        dst_path = self._copy_files_for_processing(
+            input_dicom_path, output_dir, hardlink=True
+        )
 
         # Process DICOM file
         output_location = self._redact_single_dicom_image(
@@ -200,6 +265,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             save_bboxes=save_bboxes,
             ocr_kwargs=ocr_kwargs,
             ad_hoc_recognizers=ad_hoc_recognizers,
+            hardlinked=True,
             **text_analyzer_kwargs,
         )
 
@@ -219,6 +285,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool = False,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        max_workers: Optional[int] = 1,
         **text_analyzer_kwargs,
     ) -> None:
         """Redact method to redact from a directory of files.
@@ -239,10 +306,12 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param max_workers: Number of processes used to redact the files
+        in parallel (1 to redact sequentially, None to use all CPUs).
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
         """
-        # Verify the given paths
+        # Verify the given paths and number of workers
         if Path(input_dicom_path).is_dir() is False:
             raise TypeError("input_dicom_path must be a valid directory")
         if Path(input_dicom_path).is_file() is True:
@@ -251,9 +320,13 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             raise TypeError(
                 "output_dir must be a directory (does not need to exist yet)"
             )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer or None")
 
         # Create duplicates
-        dst_path = self._copy_files_for_processing(input_dicom_path, output_dir)
+        dst_path = self._copy_files_for_processing(
+            input_dicom_path, output_dir, hardlink=True
+        )
 
         # Process DICOM files
         output_location = self._redact_multiple_dicom_images(
@@ -267,6 +340,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             dst_parent_dir=".",
             save_bboxes=save_bboxes,
             ocr_kwargs=ocr_kwargs,
+            max_workers=max_workers,
+            hardlinked=True,
             **text_analyzer_kwargs,
         )
 
@@ -282,15 +357,15 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         :return: List of pathlib Path objects.
         """
-        # Define applicable extensions
-        extensions = ["[dD][cC][mM]", "[dD][iI][cC][oO][mM]"]
+        # Define applicable extensions (case insensitive)
+        extensions = (".dcm", ".dicom")
 
-        # Get all files with any applicable extension
+        # Get all files with any applicable extension in a single directory walk
         all_files = []
-        for extension in extensions:
-            p = dcm_dir.glob(f"**/*.{extension}")
-            files = [x for x in p if x.is_file()]
-            all_files += files
+        for root, _, files in os.walk(dcm_dir):
+            for file in files:
+                if file.lower().endswith(extensions):
+                    all_files.append(Path(root, file))
 
         return all_files
 
@@ -331,110 +406,163 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         else:
             image_2d = instance.pixel_array
 
-        # Convert to float to avoid overflow or underflow losses.
-        image_2d_float = image_2d.astype(float)
-
         if not is_greyscale:
-            image_2d_scaled = image_2d_float
+            # Color values are already within 0-255, so avoid any float copy
+            # (uint8 pixel data is returned as is, without copying)
+            if image_2d.dtype == np.uint8:
+                image_2d_scaled = image_2d
+            else:
+                image_2d_scaled = np.clip(image_2d, 0, 255).astype(np.uint8)
         else:
-            # Rescaling grey scale between 0-255
-            image_2d_scaled = ((image_2d_float.max() - image_2d_float) / (
-                    image_2d_float.max() - image_2d_float.min())) * 255.0
-
-        # Convert to uint
-        image_2d_scaled = np.uint8(image_2d_scaled)
+            # Rescaling grey scale between 0-255 (in place on a float32 buffer).
+            # Multiply before dividing so exact values are not truncated down.
+            image_max = float(image_2d.max())
+            image_range = image_max - float(image_2d.min())
+            image_2d_scaled = np.subtract(image_max, image_2d, dtype=np.float32)
+            if image_range > 0:
+                np.multiply(image_2d_scaled, 255.0, out=image_2d_scaled)
+                np.divide(image_2d_scaled, image_range, out=image_2d_scaled)
+
+            # Convert to uint
+            image_2d_scaled = image_2d_scaled.astype(np.uint8)
 
         return image_2d_scaled
 
     @staticmethod
     def _save_pixel_array_as_png(
         pixel_array: np.array,
-        is_greyscale: bool,
+        is_greyscale: Optional[bool] = None,
         output_file_name: str = "example",
         output_dir: str = "temp_dir",
     ) -> None:
         """Save the pixel data from a loaded DICOM instance as PNG.
 
         :param pixel_array: Pixel data from the instance.
-        :param is_greyscale: True if image is greyscale.
+        :param is_greyscale: (DEPRECATED) Not used, as the image mode
+        is inferred from the shape of the pixel array.
         :param output_file_name: Name of output file (no file extension).
         :param output_dir: String path to output directory.
         """
-        shape = pixel_array.shape
+        if is_greyscale is not None:
+            warnings.warn(
+                "is_greyscale is deprecated and isn't used; "
+                "the image mode is inferred from the pixel array",
+                DeprecationWarning,
+                2,
+            )
 
-        # Write the PNG file
+        # Write the PNG file (intermediate only, so favor speed over file size)
         os.makedirs(output_dir, exist_ok=True)
-        if is_greyscale:
-            with open(f"{output_dir}/{output_file_name}.png", "wb") as png_file:
-                w = png.Writer(shape[1], shape[0], greyscale=True)
-                w.write(png_file, pixel_array)
-        else:
-            with open(f"{output_dir}/{output_file_name}.png", "wb") as png_file:
-                w = png.Writer(shape[1], shape[0], greyscale=False)
-                # Semi-flatten the pixel array to RGB representation in 2D
-                pixel_array = np.reshape(pixel_array, (shape[0], shape[1] * 3))
-                w.write(png_file, pixel_array)
+        # Mode ("L" or "RGB") is inferred from the shape of the uint8 array
+        image = Image.fromarray(pixel_array)
+        image.save(
+            f"{output_dir}/{output_file_name}.png", format="PNG", compress_level=1
+        )
 
         return None
 
     @classmethod
-    def _convert_dcm_to_png(cls, filepath: Path, output_dir: str = "temp_dir") -> tuple:
-        """Convert DICOM image to PNG file.
+    def _dcm_to_pil(cls, filepath: Path) -> Tuple[Image.Image, bool]:
+        """Convert DICOM image to an in-memory PIL image.
 
         :param filepath: pathlib Path to a single dcm file.
-        :param output_dir: String path to output directory.
 
-        :return: Shape of pixel array and if image mode is greyscale.
+        :return: PIL image of the rescaled pixel array and if image mode is greyscale.
         """
         ds = pydicom.dcmread(filepath)
 
+        return cls._instance_to_pil(ds)
+
+    @classmethod
+    def _instance_to_pil(
+        cls, instance: pydicom.dataset.FileDataset
+    ) -> Tuple[Image.Image, bool]:
+        """Convert an already loaded DICOM instance to an in-memory PIL image.
+
+        :param instance: A single DICOM instance.
+
+        :return: PIL image of the rescaled pixel array and if image mode is greyscale.
+        """
         # Check if image is grayscale using the Photometric Interpretation element
-        is_greyscale = cls._check_if_greyscale(ds)
+        is_greyscale = cls._check_if_greyscale(instance)
 
         # Rescale pixel array
-        image = cls._rescale_dcm_pixel_array(ds, is_greyscale)
-        shape = image.shape
+        image = cls._rescale_dcm_pixel_array(instance, is_greyscale)
+
+        return Image.fromarray(image), is_greyscale
+
+    @classmethod
+    def _convert_dcm_to_png(cls, filepath: Path, output_dir: str = "temp_dir") -> tuple:
+        """Convert DICOM image to PNG file.
+
+        :param filepath: pathlib Path to a single dcm file.
+        :param output_dir: String path to output directory.
 
-        # Write to PNG file
-        cls._save_pixel_array_as_png(image, is_greyscale, filepath.stem, output_dir)
+        :return: Shape of pixel array and if image mode is greyscale.
+        """
+        image, is_greyscale = cls._dcm_to_pil(filepath)
+
+        # Shape of the rescaled pixel array the image was created from
+        num_bands = len(image.getbands())
+        shape = (image.height, image.width)
+        if num_bands > 1:
+            shape += (num_bands,)
+
+        # Write to PNG file (intermediate only, so favor speed over file size)
+        os.makedirs(output_dir, exist_ok=True)
+        image.save(
+            f"{output_dir}/{filepath.stem}.png", format="PNG", compress_level=1
+        )
 
         return shape, is_greyscale
 
-    @staticmethod
+    @classmethod
     def _get_bg_color(
-        image: Image.Image, is_greyscale: bool, invert: bool = False
+        cls, image: Image.Image, is_greyscale: bool, invert: bool = False
     ) -> Union[int, Tuple[int, int, int]]:
         """Select most common color as background color.
 
         :param image: Loaded PIL image.
-        :param colorscale: Colorscale of image (e.g., 'grayscale', 'RGB')
+        :param is_greyscale: Whether the image is greyscale.
         :param invert: TRUE if you want to get the inverse of the bg color.
 
         :return: Background color.
         """
-        # Invert colors if invert flag is True
-        if invert:
-            if image.mode == "RGBA":
-                # Handle transparency as needed
-                r, g, b, a = image.split()
-                rgb_image = Image.merge("RGB", (r, g, b))
-                inverted_image = ImageOps.invert(rgb_image)
-                r2, g2, b2 = inverted_image.split()
+        return cls._get_bg_color_from_array(np.asarray(image), is_greyscale, invert)
 
-                image = Image.merge("RGBA", (r2, g2, b2, a))
+    @staticmethod
+    def _get_bg_color_from_array(
+        pixel_array: np.ndarray, is_greyscale: bool, invert: bool = False
+    ) -> Union[int, Tuple[int, int, int]]:
+        """Select most common color as background color from a pixel array.
 
-            else:
-                image = ImageOps.invert(image)
+        Gives the same result as _get_bg_color on the equivalent PIL image.
+
+        :param pixel_array: Rescaled (uint8) pixel array.
+        :param is_greyscale: Whether the image is greyscale.
+        :param invert: TRUE if you want to get the inverse of the bg color.
 
-        # Get background color
+        :return: Background color.
+        """
         if is_greyscale:
             # Select most common color as color
-            bg_color = int(np.bincount(list(image.getdata())).argmax())
+            counts = np.bincount(pixel_array.ravel(), minlength=256)
+            if invert:
+                # Reversed counts are the counts of the inverted image
+                counts = counts[::-1]
+            bg_color = int(counts.argmax())
         else:
-            # Reduce size of image to 1 pixel to get dominant color
-            tmp_image = image.copy()
-            tmp_image = tmp_image.resize((1, 1), resample=0)
-            bg_color = tmp_image.getpixel((0, 0))
+            # Use the center pixel, as when reducing the image to 1 pixel
+            height, width = pixel_array.shape[:2]
+            color = np.atleast_1d(pixel_array[height // 2, width // 2]).astype(int)
+            if invert:
+                # Invert color channels only (keep transparency as is)
+                np.subtract(255, color[:3], out=color[:3])
+            if color.size > 1:
+                bg_color = tuple(int(value) for value in color)
+            else:
+                # Single channel (e.g., palette) images have a single value
+                bg_color = int(color[0])
 
         return bg_color
 
@@ -481,6 +609,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         instance: pydicom.dataset.FileDataset,
         crop_ratio: float,
         fill: str = "contrast",
+        is_greyscale: Optional[bool] = None,
     ) -> Union[int, Tuple[int, int, int]]:
         """Find the most common pixel value.
 
@@ -490,6 +619,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param fill: Determines how box color is selected.
         'contrast' - Masks stand out relative to background.
         'background' - Masks are same color as background.
+        :param is_greyscale: Whether the instance is greyscale
+        (checked on the instance if not provided).
 
         :return: Most or least common pixel value (depending on fill).
         """
@@ -497,14 +628,21 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         cropped_array = cls._get_array_corners(instance.pixel_array, crop_ratio)
 
         # Get flattened pixel array
-        flat_pixel_array = np.array(cropped_array).flatten()
+        flat_pixel_array = np.ascontiguousarray(cropped_array).ravel()
 
-        is_greyscale = cls._check_if_greyscale(instance)
+        if is_greyscale is None:
+            is_greyscale = cls._check_if_greyscale(instance)
         if is_greyscale:
             # Get most common value
-            values, counts = np.unique(flat_pixel_array, return_counts=True)
-            flat_pixel_array = np.array(flat_pixel_array)
-            common_value = values[np.argmax(counts)]
+            if flat_pixel_array.dtype.kind == "u" and flat_pixel_array.itemsize <= 2:
+                # Single linear counting pass for unsigned 8/16-bit data
+                counts = np.bincount(flat_pixel_array)
+                common_value = counts.argmax()
+                max_value = counts.size - 1
+            else:
+                values, counts = np.unique(flat_pixel_array, return_counts=True)
+                common_value = values[np.argmax(counts)]
+                max_value = values[-1]
         else:
             raise TypeError(
                 "Most common pixel value retrieval is only supported for greyscale images at this point."  # noqa: E501
@@ -512,7 +650,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Invert color as necessary
         if fill.lower() in ["contrast", "invert", "inverted", "inverse"]:
-            pixel_value = np.max(flat_pixel_array) - common_value
+            pixel_value = max_value - common_value
         elif fill.lower() in ["background", "bg"]:
             pixel_value = common_value
 
@@ -563,11 +701,59 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         return image_with_padding
 
     @staticmethod
-    def _copy_files_for_processing(src_path: str, dst_parent_dir: str) -> Path:
+    def _link_or_copy(src: str, dst: str) -> str:
+        """Hard link a file, falling back to a copy if linking is not possible.
+
+        :param src: String path to the source file.
+        :param dst: String path to the destination file.
+
+        :return: Destination path.
+        """
+        try:
+            os.link(src, dst)
+        except OSError:
+            # e.g., across devices or on file systems without hard links
+            shutil.copy2(src, dst)
+
+        return dst
+
+    @classmethod
+    def _link_dicom_or_copy(cls, src: str, dst: str) -> str:
+        """Hard link DICOM files and copy all other files.
+
+        DICOM files are replaced when redacted, while other files
+        (e.g., saved bounding boxes) may be written into.
+
+        :param src: String path to the source file.
+        :param dst: String path to the destination file.
+
+        :return: Destination path.
+        """
+        if str(src).lower().endswith((".dcm", ".dicom")):
+            return cls._link_or_copy(src, dst)
+
+        return shutil.copy2(src, dst)
+
+    @staticmethod
+    def _replace_hardlink_with_copy(path: str) -> None:
+        """Replace a hard linked file with a copy that has its own inode.
+
+        :param path: String path to the hard linked file.
+        """
+        tmp_path = Path(path).with_name(f".{Path(path).name}.copy")
+        shutil.copy2(path, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def _copy_files_for_processing(
+        cls, src_path: str, dst_parent_dir: str, hardlink: bool = False
+    ) -> Path:
         """Copy DICOM files. All processing should be done on the copies.
 
         :param src_path: String path to DICOM file or directory containing DICOM files.
         :param dst_parent_dir: String path to parent directory of output location.
+        :param hardlink: Hard link the DICOM files instead of copying them. Only
+        use this if the copies are replaced (not written into) when processed.
 
         :return: Output location of the file(s).
         """
@@ -577,8 +763,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Copy file(s)
         if Path(src_path).is_dir() is True:
+            copy_function = cls._link_dicom_or_copy if hardlink else shutil.copy2
             try:
-                shutil.copytree(src_path, dst_path)
+                shutil.copytree(src_path, dst_path, copy_function=copy_function)
             except FileExistsError:
                 raise FileExistsError(
                     "Destination files already exist. Please clear the destination files or specify a different dst_parent_dir."  # noqa: E501
@@ -586,7 +773,17 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         elif Path(src_path).is_file() is True:
             # Create the output dir manually if working with a single file
             os.makedirs(Path(dst_path).parent, exist_ok=True)
-            shutil.copyfile(src_path, dst_path)
+            if hardlink:
+                # Replace any previous output rather than writing into it
+                if os.path.lexists(dst_path):
+                    if os.path.samefile(src_path, dst_path):
+                        raise shutil.SameFileError(
+                            f"{src_path} and {dst_path} are the same file"
+                        )
+                    os.unlink(dst_path)
+                cls._link_or_copy(src_path, dst_path)
+            else:
+                shutil.copyfile(src_path, dst_path)
         else:
             raise FileNotFoundError(f"{src_path} does not exist")
 
@@ -706,10 +903,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         """
         phi_list = text_metadata.copy()
 
-        for i in range(0, len(text_metadata)):
-            if is_name[i] is True:
-                original_text = str(text_metadata[i])
-                phi_list += cls.augment_word(original_text)
+        for text, text_is_name in zip(text_metadata, is_name):
+            if text_is_name is True:
+                phi_list.extend(cls.augment_word(str(text)))
 
         return phi_list
 
@@ -749,24 +945,28 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         # Add known potential phi values
         phi_list = cls._add_known_generic_phi(phi_list)
 
-        # Flatten any nested lists
-        for phi in phi_list:
+        # Flatten any nested lists, convert all items to strings
+        # and remove duplicates in a single pass
+        phi_str_set = set()
+        pending = list(phi_list)
+        while pending:
+            phi = pending.pop()
             if type(phi) in [pydicom.multival.MultiValue, list, tuple]:
-                for item in phi:
-                    phi_list.append(item)
-                phi_list.remove(phi)
-
-        # Convert all items to strings
-        phi_str_list = [str(phi) for phi in phi_list]
+                pending.extend(phi)
+            else:
+                phi_str_set.add(str(phi))
 
-        # Remove duplicates
-        phi_str_list = list(set(phi_str_list))
+        phi_str_list = list(phi_str_set)
 
         return phi_str_list
 
     @classmethod
     def _set_bbox_color(
-        cls, instance: pydicom.dataset.FileDataset, fill: str
+        cls,
+        instance: pydicom.dataset.FileDataset,
+        fill: str,
+        rescaled_pixels: Optional[np.ndarray] = None,
+        is_greyscale: Optional[bool] = None,
     ) -> Union[int, Tuple[int, int, int]]:
         """Set the bounding box color.
 
@@ -774,6 +974,10 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param fill: Determines how box color is selected.
         'contrast' - Masks stand out relative to background.
         'background' - Masks are same color as background.
+        :param rescaled_pixels: Already rescaled pixel array of the instance
+        (computed from the instance if not provided).
+        :param is_greyscale: Whether the instance is greyscale
+        (checked on the instance if not provided).
 
         :return: int or tuple of int values determining masking box color.
         """
@@ -785,15 +989,14 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         else:
             raise ValueError("fill must be 'contrast' or 'background'")
 
-        # Temporarily save as PNG to get color
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            dst_path = Path(f"{tmpdirname}/temp.dcm")
-            instance.save_as(dst_path)
-            _, is_greyscale = cls._convert_dcm_to_png(dst_path, output_dir=tmpdirname)
-
-            png_filepath = f"{tmpdirname}/{dst_path.stem}.png"
-            loaded_image = Image.open(png_filepath)
-            box_color = cls._get_bg_color(loaded_image, is_greyscale, invert_flag)
+        # Get color from the rescaled pixel array
+        if is_greyscale is None:
+            is_greyscale = cls._check_if_greyscale(instance)
+        if rescaled_pixels is None:
+            rescaled_pixels = cls._rescale_dcm_pixel_array(instance, is_greyscale)
+        box_color = cls._get_bg_color_from_array(
+            rescaled_pixels, is_greyscale, invert_flag
+        )
 
         return box_color
 
@@ -865,6 +1068,84 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return has_image_icon_sequence
 
+    @staticmethod
+    def _copy_instance_for_redaction(
+        instance: pydicom.dataset.FileDataset,
+    ) -> pydicom.dataset.FileDataset:
+        """Copy a DICOM instance without duplicating element values.
+
+        Every top-level element is copied, so setting an element on the copy
+        (e.g., when recompressing) leaves the original instance unchanged.
+        Element values, including sequences, are shared with the original
+        and must be replaced rather than modified in place.
+
+        :param instance: A single DICOM instance.
+
+        :return: Copy of the instance which is safe to redact.
+        """
+        if not isinstance(instance, pydicom.dataset.FileDataset):
+            # Plain datasets share their element mapping on shallow copy
+            return deepcopy(instance)
+
+        redacted_instance = copy(instance)
+        for element in instance.elements():
+            redacted_instance[element.tag] = copy(element)
+        if hasattr(instance, "file_meta"):
+            redacted_instance.file_meta = deepcopy(instance.file_meta)
+
+        return redacted_instance
+
+    @staticmethod
+    def _fill_bboxes(
+        pixels: np.ndarray,
+        bounding_boxes_coordinates: list,
+        box_color: Union[int, Tuple[int, int, int]],
+    ) -> None:
+        """Fill bounding boxes on a pixel array with the box color (in place).
+
+        Uses a compiled kernel if numba is installed and NumPy slicing otherwise.
+
+        :param pixels: C-contiguous pixel array to redact.
+        :param bounding_boxes_coordinates: Bounding box coordinates.
+        :param box_color: Color of the redaction boxes.
+        """
+        # The kernel needs one color value for all samples or one per sample
+        # (e.g., not one per channel of a multi-frame RGB array)
+        num_samples = int(np.prod(pixels.shape[2:]))
+        color_size = np.asarray(box_color).size
+        if (
+            njit is None
+            or not pixels.flags.c_contiguous
+            or color_size not in (1, num_samples)
+        ):
+            for bbox in bounding_boxes_coordinates:
+                top = bbox["top"]
+                left = bbox["left"]
+                pixels[
+                    top : top + bbox["height"], left : left + bbox["width"]
+                ] = box_color
+            return None
+
+        coordinates = BboxProcessor.get_bbox_coordinate_arrays(
+            bounding_boxes_coordinates
+        )
+
+        # View as (rows, columns, samples) with one color value per sample
+        pixels_3d = pixels.reshape(pixels.shape[0], pixels.shape[1], -1)
+        color = np.broadcast_to(
+            np.asarray(box_color).astype(pixels.dtype), pixels_3d.shape[2:]
+        ).copy()
+        _fill_bboxes_kernel(
+            pixels_3d,
+            coordinates["top"],
+            coordinates["left"],
+            coordinates["height"],
+            coordinates["width"],
+            color,
+        )
+
+        return None
+
     @classmethod
     def _add_redact_box(
         cls,
@@ -872,6 +1153,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         bounding_boxes_coordinates: list,
         crop_ratio: float,
         fill: str = "contrast",
+        rescaled_pixels: Optional[np.ndarray] = None,
+        is_greyscale: Optional[bool] = None,
     ) -> pydicom.dataset.FileDataset:
         """Add redaction bounding boxes on a DICOM instance.
 
@@ -882,35 +1165,46 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param fill: Determines how box color is selected.
         'contrast' - Masks stand out relative to background.
         'background' - Masks are same color as background.
+        :param rescaled_pixels: Already rescaled pixel array of the instance,
+        reused to select the box color of non-greyscale images.
+        :param is_greyscale: Whether the instance is greyscale
+        (checked on the instance if not provided).
 
         :return: A new dicom instance with redaction bounding boxes.
         """
         # Copy instance
-        redacted_instance = deepcopy(instance)
+        redacted_instance = cls._copy_instance_for_redaction(instance)
+
+        # Nothing to redact, so leave the pixel data untouched
+        if not bounding_boxes_coordinates:
+            return redacted_instance
+
         is_compressed = cls._check_if_compressed(redacted_instance)
         has_image_icon_sequence = cls._check_if_has_image_icon_sequence(
             redacted_instance
         )
 
         # Select masking box color
-        is_greyscale = cls._check_if_greyscale(instance)
+        if is_greyscale is None:
+            is_greyscale = cls._check_if_greyscale(instance)
         if is_greyscale:
-            box_color = cls._get_most_common_pixel_value(instance, crop_ratio, fill)
+            box_color = cls._get_most_common_pixel_value(
+                instance, crop_ratio, fill, is_greyscale=is_greyscale
+            )
         else:
-            box_color = cls._set_bbox_color(redacted_instance, fill)
+            box_color = cls._set_bbox_color(
+                redacted_instance,
+                fill,
+                rescaled_pixels=rescaled_pixels,
+                is_greyscale=is_greyscale,
+            )
 
-        # Apply mask
-        for i in range(0, len(bounding_boxes_coordinates)):
-            bbox = bounding_boxes_coordinates[i]
-            top = bbox["top"]
-            left = bbox["left"]
-            width = bbox["width"]
-            height = bbox["height"]
-            redacted_instance.pixel_array[
-                top : top + height, left : left + width
-            ] = box_color
+        # Apply mask on a fresh pixel buffer (original pixel array is shared),
+        # decoding the pixel data only once for all bounding boxes
+        pixels = instance.pixel_array.copy()
+        cls._fill_bboxes(pixels, bounding_boxes_coordinates, box_color)
 
-        redacted_instance.PixelData = redacted_instance.pixel_array.tobytes()
+        redacted_instance.PixelData = pixels.tobytes()
 
         # If original pixel data is compressed, recompress after redaction
         if is_compressed or has_image_icon_sequence:
@@ -1002,6 +1296,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        hardlinked: bool = False,
         **text_analyzer_kwargs,
     ) -> str:
         """Redact text PHI present on a DICOM image.
@@ -1021,6 +1316,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param hardlinked: Only set to True if dcm_path was hard linked by
+        _copy_files_for_processing (the output then replaces the link).
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -1034,7 +1331,10 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Copy file before processing if overwrite==False
         if overwrite is False:
-            dst_path = self._copy_files_for_processing(dcm_path, dst_parent_dir)
+            dst_path = self._copy_files_for_processing(
+                dcm_path, dst_parent_dir, hardlink=True
+            )
+            hardlinked = True
         else:
             dst_path = dcm_path
 
@@ -1046,13 +1346,10 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         except AttributeError:
             raise AttributeError("Provided DICOM file lacks pixel data.")
 
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            _, is_greyscale = self._convert_dcm_to_png(dst_path, output_dir=tmpdirname)
-            png_filepath = f"{tmpdirname}/{dst_path.stem}.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+        # Convert DICOM to PIL image and add padding for OCR (during analysis)
+        loaded_image, is_greyscale = self._instance_to_pil(instance)
+        rescaled_pixels = np.asarray(loaded_image)
+        image = self._add_padding(loaded_image, is_greyscale, padding_width)
 
         # Detect PII
         analyzer_results = self._get_analyzer_results(
@@ -1069,10 +1366,24 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             analyzer_results
         )
         bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
-        redacted_dicom_instance = self._add_redact_box(
-            instance, bboxes, crop_ratio, fill
-        )
-        redacted_dicom_instance.save_as(dst_path)
+
+        # Only rewrite the file if there is something to redact
+        if bboxes:
+            redacted_dicom_instance = self._add_redact_box(
+                instance,
+                bboxes,
+                crop_ratio,
+                fill,
+                rescaled_pixels=rescaled_pixels,
+                is_greyscale=is_greyscale,
+            )
+            # Write a new file instead of writing through a hard link to the source
+            if hardlinked and os.stat(dst_path).st_nlink > 1:
+                os.unlink(dst_path)
+            redacted_dicom_instance.save_as(dst_path)
+        elif hardlinked and os.stat(dst_path).st_nlink > 1:
+            # Nothing to redact, but the output must not stay linked to the source
+            self._replace_hardlink_with_copy(dst_path)
 
         # Save redacted bboxes
         if save_bboxes:
@@ -1092,6 +1403,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        max_workers: Optional[int] = 1,
+        hardlinked: bool = False,
         **text_analyzer_kwargs,
     ) -> str:
         """Redact text PHI present on all DICOM images in a directory.
@@ -1111,6 +1424,10 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param max_workers: Number of processes used to redact the files
+        in parallel (1 to redact sequentially, None to use all CPUs).
+        :param hardlinked: Only set to True if the files in dcm_dir were hard
+        linked by _copy_files_for_processing (the outputs then replace the links).
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -1122,8 +1439,11 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             raise FileNotFoundError("Please ensure dcm_path is a directory")
         elif Path(dcm_dir).is_dir() is False:
             raise FileNotFoundError(f"{dcm_dir} does not exist")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer or None")
 
-        # List of files to process directly
+        # List of files to process directly (not hard linked, as the
+        # files are copied again rather than replaced when redacted)
         if overwrite is False:
             dst_dir = self._copy_files_for_processing(dcm_dir, dst_parent_dir)
         else:
@@ -1131,19 +1451,37 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Process each DICOM file directly
         all_dcm_files = self._get_all_dcm_files(Path(dst_dir))
-        for dst_path in all_dcm_files:
-            self._redact_single_dicom_image(
-                dst_path,
-                crop_ratio,
-                fill,
-                padding_width,
-                use_metadata,
-                overwrite,
-                dst_parent_dir,
-                save_bboxes,
-                ocr_kwargs=ocr_kwargs,
-                ad_hoc_recognizers=ad_hoc_recognizers,
-                **text_analyzer_kwargs,
-            )
+        redact_single_dicom_image = partial(
+            self._redact_single_dicom_image,
+            crop_ratio=crop_ratio,
+            fill=fill,
+            padding_width=padding_width,
+            use_metadata=use_metadata,
+            overwrite=overwrite,
+            dst_parent_dir=dst_parent_dir,
+            save_bboxes=save_bboxes,
+            ocr_kwargs=ocr_kwargs,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+            hardlinked=hardlinked,
+            **text_analyzer_kwargs,
+        )
+        if max_workers == 1:
+            for dst_path in all_dcm_files:
+                redact_single_dicom_image(dst_path)
+        else:
+            # Files are independent, so redact them in parallel processes.
+            # The engine is sent once per worker, then only paths are sent.
+            num_workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(all_dcm_files) // (num_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_redaction_worker,
+                initargs=(redact_single_dicom_image,),
+            ) as executor:
+                list(
+                    executor.map(
+                        _redact_in_worker, all_dcm_files, chunksize=chunksize
+                    )
+                )
 
         return dst_dir
@@ -10,7 +10,6 @@ requirements = [
     "presidio-analyzer>=1.9.0",
     "matplotlib>=3.6",
     "pydicom>=2.3.0",
-    "pypng>=0.20220715.0",
 ]
 
 test_requirements = ["pytest>=3", "pytest-mock>=3.10.0", "flake8>=3.7.9"]
@@ -36,6 +35,9 @@ setup(
     trusted_host=["pypi.org"],
     tests_require=test_requirements,
     install_requires=requirements,
+    extras_require={
+        "numba": ["numba"],
+    },
     include_package_data=True,
     license="MIT",
     keywords="presidio_image_redactor",
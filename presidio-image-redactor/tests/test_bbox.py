@@ -263,6 +263,44 @@ def test_remove_bbox_padding_exceptions(
     assert expected_error_type == exc_info.typename
 
 
+# ------------------------------------------------------
+# BboxProcessor.get_bbox_coordinate_arrays()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "bboxes, expected_arrays",
+    [
+        ([], {"left": [], "top": [], "width": [], "height": []}),
+        (
+            [
+                {"left": 0, "top": 0, "width": 100, "height": 100, "entity_type": "TYPE_1"},
+                {"left": 588, "top": 1, "width": 226, "height": 35, "entity_type": "TYPE_3"},
+            ],
+            {"left": [0, 588], "top": [0, 1], "width": [100, 226], "height": [100, 35]},
+        ),
+    ],
+)
+def test_get_bbox_coordinate_arrays_happy_path(
+    mock_bbox_processor: BboxProcessor,
+    bboxes: list,
+    expected_arrays: dict,
+):
+    """Test happy path for BboxProcessor.get_bbox_coordinate_arrays
+
+    Args:
+        bboxes (list): Bounding boxes with padding removed.
+        expected_arrays (dict): Expected coordinate values per field.
+    """
+    # Arrange
+
+    # Act
+    test_arrays = mock_bbox_processor.get_bbox_coordinate_arrays(bboxes)
+
+    # Assert
+    assert set(test_arrays.keys()) == set(expected_arrays.keys())
+    for field, expected_values in expected_arrays.items():
+        assert test_arrays[field].tolist() == expected_values
+
+
 # ------------------------------------------------------
 # DicomImagePiiVerifyEngine._match_with_source()
 # ------------------------------------------------------
@@ -76,11 +76,8 @@ def test_verify_dicom_instance_happy_path(
     mock_rescale_array = mocker.patch.object(
         DicomImagePiiVerifyEngine, "_rescale_dcm_pixel_array", return_value=None
     )
-    mock_save_pixel_array = mocker.patch.object(
-        DicomImagePiiVerifyEngine, "_save_pixel_array_as_png", return_value=None
-    )
-    mock_image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_pii_verify_engine.Image.open",
+    mock_image_fromarray = mocker.patch(
+        "presidio_image_redactor.dicom_image_pii_verify_engine.Image.fromarray",
         return_value=None,
     )
     mock_add_padding = mocker.patch.object(
@@ -114,8 +111,7 @@ def test_verify_dicom_instance_happy_path(
     # Assert
     assert mock_greyscale.call_count == 1
     assert mock_rescale_array.call_count == 1
-    assert mock_save_pixel_array.call_count == 1
-    assert mock_image_open.call_count == 1
+    assert mock_image_fromarray.call_count == 1
     assert mock_add_padding.call_count == 1
     assert mock_parse_ocr_kwargs.call_count == 1
     assert mock_perform_ocr.call_count == 1
@@ -7,7 +7,8 @@ import numpy as np
 from PIL import Image
 import pydicom
 from presidio_image_redactor.dicom_image_redactor_engine import DicomImageRedactorEngine
-from presidio_analyzer import PatternRecognizer
+from presidio_image_redactor.entities import ImageRecognizerResult
+from presidio_analyzer import PatternRecognizer, Pattern
 from typing import Union, List, Tuple, Dict, TypeVar, Optional
 import pytest
 
@@ -22,6 +23,18 @@ TEST_NUMPY_DIR = f"{SCRIPT_DIR}/test_data/numpy_arrays"
 TEST_PNG_DIR = f"{SCRIPT_DIR}/test_data/png_images"
 
 
+class StubAnalysisDicomImageRedactorEngine(DicomImageRedactorEngine):
+    """Picklable engine which detects a fixed PII box instead of running OCR"""
+
+    def _get_analyzer_results(self, image, instance, use_metadata, ocr_kwargs,
+                              ad_hoc_recognizers, **text_analyzer_kwargs):
+        return [
+            ImageRecognizerResult(
+                "PERSON", 0, 4, 1.0, left=25, top=25, width=100, height=100
+            )
+        ]
+
+
 @pytest.fixture(scope="module")
 def mock_engine():
     """Instance of the DicomImageRedactorEngine"""
@@ -166,6 +179,50 @@ def test_check_if_greyscale_happy_path(
         assert len(np.shape(test_scaled_image)) == 2
     else:
         assert len(np.shape(test_scaled_image)) == 3
+        assert np.array_equal(test_original_image, test_scaled_image)
+
+
+@pytest.mark.parametrize(
+    "pixel_values, expected_scaled_values",
+    [
+        ([0, 7], [255, 0]),
+        ([0, 1, 2, 3, 4, 5, 6, 7], [255, 218, 182, 145, 109, 72, 36, 0]),
+        ([3, 3], [0, 0]),
+    ],
+)
+def test_rescale_dcm_pixel_array_greyscale_values(
+    mock_engine: DicomImageRedactorEngine,
+    pixel_values: list,
+    expected_scaled_values: list,
+):
+    """Test DicomImageRedactorEngine._rescale_dcm_pixel_array greyscale values
+
+    Args:
+        pixel_values (list): Values of a single row greyscale image.
+        expected_scaled_values (list): Expected values after rescaling.
+    """
+    # Arrange
+    pixel_array = np.array([pixel_values], dtype=np.uint16)
+    test_instance = pydicom.Dataset()
+    test_instance.file_meta = pydicom.dataset.FileMetaDataset()
+    test_instance.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    test_instance.is_little_endian = True
+    test_instance.is_implicit_VR = False
+    test_instance.Rows, test_instance.Columns = pixel_array.shape
+    test_instance.SamplesPerPixel = 1
+    test_instance.PhotometricInterpretation = "MONOCHROME2"
+    test_instance.BitsAllocated = 16
+    test_instance.BitsStored = 16
+    test_instance.HighBit = 15
+    test_instance.PixelRepresentation = 0
+    test_instance.PixelData = pixel_array.tobytes()
+
+    # Act
+    test_scaled_image = mock_engine._rescale_dcm_pixel_array(test_instance, True)
+
+    # Assert
+    assert test_scaled_image.dtype == np.uint8
+    assert test_scaled_image.tolist() == [expected_scaled_values]
 
 
 # ------------------------------------------------------
@@ -224,7 +281,7 @@ def test_save_pixel_array_as_png_happy_path(
     with tempfile.TemporaryDirectory() as tmpdirname:
         # Act
         _ = mock_engine._save_pixel_array_as_png(
-            test_image, is_greyscale, filename, tmpdirname
+            test_image, output_file_name=filename, output_dir=tmpdirname
         )
 
         # Assert
@@ -232,40 +289,144 @@ def test_save_pixel_array_as_png_happy_path(
         assert f"{filename}.png" in os.listdir(tmpdirname)
 
 
+def test_save_pixel_array_as_png_is_greyscale_deprecated(
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test passing is_greyscale to _save_pixel_array_as_png warns
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        with pytest.deprecated_call():
+            # Act
+            mock_engine._save_pixel_array_as_png(
+                np.zeros((2, 3), dtype=np.uint8), True, "test", tmpdirname
+            )
+
+        # Assert
+        assert "test.png" in os.listdir(tmpdirname)
+
+
 # ------------------------------------------------------
-# DicomImageRedactorEngine._convert_dcm_to_png()
+# DicomImageRedactorEngine._dcm_to_pil()
 # ------------------------------------------------------
-def test_convert_dcm_to_png_happy_path(mocker):
-    """Test happy path for DicomImageRedactorEngine._convert_dcm_to_png"""
+@pytest.mark.parametrize(
+    "dcm_file, expected_mode, expected_is_greyscale",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "L", True),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), "RGB", False),
+    ],
+)
+def test_dcm_to_pil_happy_path(
+    mock_engine: DicomImageRedactorEngine,
+    dcm_file: Path,
+    expected_mode: str,
+    expected_is_greyscale: bool,
+):
+    """Test happy path for DicomImageRedactorEngine._dcm_to_pil
+
+    Args:
+        dcm_file (pathlib.Path): Path to a DICOM file.
+        expected_mode (str): Expected mode of the PIL image.
+        expected_is_greyscale (bool): If loaded DICOM image is greyscale or not.
+    """
     # Arrange
-    mock_dcm_read = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.pydicom.dcmread",
-        return_value=None,
+    test_instance = pydicom.dcmread(dcm_file)
+    expected_array = mock_engine._rescale_dcm_pixel_array(
+        test_instance, expected_is_greyscale
     )
-    mock_check_if_gresycale = mocker.patch.object(
-        DicomImageRedactorEngine,
-        "_check_if_greyscale",
-        return_value=True,
+
+    # Act
+    test_image, test_is_greyscale = mock_engine._dcm_to_pil(dcm_file)
+
+    # Assert
+    assert test_image.mode == expected_mode
+    assert test_is_greyscale == expected_is_greyscale
+    assert np.array_equal(np.asarray(test_image), expected_array)
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._instance_to_pil()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "dcm_file, expected_mode, expected_is_greyscale",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "L", True),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), "RGB", False),
+    ],
+)
+def test_instance_to_pil_happy_path(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    dcm_file: Path,
+    expected_mode: str,
+    expected_is_greyscale: bool,
+):
+    """Test happy path for DicomImageRedactorEngine._instance_to_pil
+
+    Args:
+        dcm_file (pathlib.Path): Path to a DICOM file.
+        expected_mode (str): Expected mode of the PIL image.
+        expected_is_greyscale (bool): If loaded DICOM image is greyscale or not.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_file)
+    mock_dcmread = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.pydicom.dcmread",
     )
-    mock_rescale_dcm_pixel_array = mocker.patch.object(
+
+    # Act
+    test_image, test_is_greyscale = mock_engine._instance_to_pil(test_instance)
+
+    # Assert
+    assert mock_dcmread.call_count == 0
+    assert test_image.mode == expected_mode
+    assert test_is_greyscale == expected_is_greyscale
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._convert_dcm_to_png()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "mock_image, mock_is_greyscale, expected_shape",
+    [
+        (Image.new("L", (3, 2)), True, (2, 3)),
+        (Image.new("RGB", (3, 2)), False, (2, 3, 3)),
+    ],
+)
+def test_convert_dcm_to_png_happy_path(
+    mocker,
+    mock_image: Image.Image,
+    mock_is_greyscale: bool,
+    expected_shape: tuple,
+):
+    """Test happy path for DicomImageRedactorEngine._convert_dcm_to_png
+
+    Args:
+        mock_image (PIL.Image): Value to use when mocking _dcm_to_pil.
+        mock_is_greyscale (bool): Value to use when mocking _dcm_to_pil.
+        expected_shape (tuple): Expected shape of the pixel array.
+    """
+    # Arrange
+    mock_dcm_to_pil = mocker.patch.object(
         DicomImageRedactorEngine,
-        "_rescale_dcm_pixel_array",
-        return_value=np.array([1, 2, 3]),
-    )
-    mock_save_array_as_png = mocker.patch.object(
-        DicomImageRedactorEngine, "_save_pixel_array_as_png", return_value=None
+        "_dcm_to_pil",
+        return_value=(mock_image, mock_is_greyscale),
     )
     mock_engine = DicomImageRedactorEngine()
 
     with tempfile.TemporaryDirectory() as tmpdirname:
         # Act
-        _, _ = mock_engine._convert_dcm_to_png(Path("filename.dcm"), tmpdirname)
+        test_shape, test_is_greyscale = mock_engine._convert_dcm_to_png(
+            Path("filename.dcm"), tmpdirname
+        )
 
         # Assert
-        assert mock_dcm_read.call_count == 1
-        assert mock_check_if_gresycale.call_count == 1
-        assert mock_rescale_dcm_pixel_array.call_count == 1
-        assert mock_save_array_as_png.call_count == 1
+        assert mock_dcm_to_pil.call_count == 1
+        assert test_shape == expected_shape
+        assert test_is_greyscale == mock_is_greyscale
+        assert "filename.png" in os.listdir(tmpdirname)
 
 
 # ------------------------------------------------------
@@ -311,6 +472,74 @@ def test_get_bg_color_happy_path(
     assert test_bg_color == expected_bg_color
 
 
+# ------------------------------------------------------
+# DicomImageRedactorEngine._get_bg_color_from_array()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "png_file, is_greyscale, invert_flag, expected_bg_color",
+    [
+        (Path(TEST_PNG_DIR, "0_ORIGINAL.png"), True, False, 243),
+        (Path(TEST_PNG_DIR, "RGB_ORIGINAL.png"), False, False, (0, 0, 0)),
+        (Path(TEST_PNG_DIR, "1_ORIGINAL.png"), True, False, 0),
+        (Path(TEST_PNG_DIR, "0_ORIGINAL.png"), True, True, 12),
+        (Path(TEST_PNG_DIR, "RGB_ORIGINAL.png"), False, True, (255, 255, 255)),
+        (Path(TEST_PNG_DIR, "1_ORIGINAL.png"), True, True, 255),
+    ],
+)
+def test_get_bg_color_from_array_happy_path(
+    mock_engine: DicomImageRedactorEngine,
+    png_file: Path,
+    is_greyscale: bool,
+    invert_flag: bool,
+    expected_bg_color: Union[int, Tuple[int, int, int]],
+):
+    """Test happy path for DicomImageRedactorEngine._get_bg_color_from_array
+
+    Args:
+        png_file (pathlib.Path): Path to a PNG file.
+        is_greyscale (bool): If loaded DICOM image is greyscale or not.
+        invert_flag (bool): True if we want to invert image colors to get foreground.
+        expected_bg_color (int or Tuple of int): The expected background color of the image.
+    """
+    # Arrange
+    test_pixel_array = np.asarray(Image.open(png_file))
+
+    # Act
+    test_bg_color = mock_engine._get_bg_color_from_array(
+        test_pixel_array, is_greyscale, invert_flag
+    )
+
+    # Assert
+    assert test_bg_color == expected_bg_color
+
+
+@pytest.mark.parametrize(
+    "invert_flag, expected_bg_color",
+    [(False, 10), (True, 245)],
+)
+def test_get_bg_color_from_array_single_channel_color(
+    mock_engine: DicomImageRedactorEngine,
+    invert_flag: bool,
+    expected_bg_color: int,
+):
+    """Test _get_bg_color_from_array on a non-greyscale single channel array
+
+    Args:
+        invert_flag (bool): True if we want to invert image colors to get foreground.
+        expected_bg_color (int): The expected background color of the image.
+    """
+    # Arrange
+    test_pixel_array = np.full((5, 5), 10, dtype=np.uint8)
+
+    # Act
+    test_bg_color = mock_engine._get_bg_color_from_array(
+        test_pixel_array, False, invert_flag
+    )
+
+    # Assert
+    assert test_bg_color == expected_bg_color
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_array_corners()
 # ------------------------------------------------------
@@ -574,6 +803,111 @@ def test_copy_files_for_processing_happy_path(
         assert expected_num_of_files == len(files)
 
 
+@pytest.mark.parametrize(
+    "src_path, link_error, expected_nlink",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), None, 2),
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), OSError, 1),
+        (Path(TEST_DICOM_DIR_2), None, 2),
+        (Path(TEST_DICOM_DIR_2), OSError, 1),
+    ],
+)
+def test_copy_files_for_processing_hardlink(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    src_path: Path,
+    link_error: Optional[type],
+    expected_nlink: int,
+):
+    """Test DicomImageRedactorEngine._copy_files_for_processing with hard links
+
+    Args:
+        src_path (pathlib.Path): Path to a file or directory to copy.
+        link_error (type): Error raised when hard linking (None if no error).
+        expected_nlink (int): Expected number of links to each copied file.
+    """
+    # Arrange
+    if link_error is not None:
+        mocker.patch(
+            "presidio_image_redactor.dicom_image_redactor_engine.os.link",
+            side_effect=link_error,
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Act
+        test_dst_path = mock_engine._copy_files_for_processing(
+            src_path, tmpdirname, hardlink=True
+        )
+
+        # Arrange
+        p = Path(tmpdirname).glob(f"**/*")
+        files = [x for x in p if x.is_file()]
+
+        # Assert
+        assert Path(tmpdirname) < test_dst_path
+        assert len(files) > 0
+        for file in files:
+            assert os.stat(file).st_nlink == expected_nlink
+
+
+def test_copy_files_for_processing_hardlink_dicom_only(
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _copy_files_for_processing only hard links DICOM files in a directory
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Arrange
+        src_dir = Path(tmpdirname, "input")
+        src_dir.mkdir()
+        with open(Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "rb") as f:
+            original_bytes = f.read()
+        with open(Path(src_dir, "0_ORIGINAL.dcm"), "wb") as f:
+            f.write(original_bytes)
+        with open(Path(src_dir, "0_ORIGINAL.json"), "w") as f:
+            json.dump([{"left": 0}], f)
+
+        # Act
+        test_dst_path = mock_engine._copy_files_for_processing(
+            src_dir, Path(tmpdirname, "output"), hardlink=True
+        )
+        mock_engine._save_bbox_json(Path(test_dst_path, "0_ORIGINAL.dcm"), [])
+
+        # Assert
+        assert os.stat(Path(test_dst_path, "0_ORIGINAL.dcm")).st_nlink == 2
+        assert os.stat(Path(test_dst_path, "0_ORIGINAL.json")).st_nlink == 1
+        with open(Path(src_dir, "0_ORIGINAL.json"), "r") as f:
+            assert json.load(f) == [{"left": 0}]
+
+
+def test_copy_files_for_processing_hardlink_same_file(
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test redact_from_file keeps the input if the output dir is its parent dir
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Arrange
+        src_path = Path(tmpdirname, "0_ORIGINAL.dcm")
+        with open(Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "rb") as f:
+            original_bytes = f.read()
+        with open(src_path, "wb") as f:
+            f.write(original_bytes)
+
+        with pytest.raises(Exception) as exc_info:
+            # Act
+            mock_engine.redact_from_file(str(src_path), tmpdirname)
+
+        # Assert
+        assert exc_info.typename == "SameFileError"
+        with open(src_path, "rb") as f:
+            assert f.read() == original_bytes
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_text_metadata()
 # ------------------------------------------------------
@@ -881,6 +1215,12 @@ def test_add_known_generic_phi_happy_path(
                 "[U]",
             ],
         ),
+        (
+            [["A", "B"], ["C", ("D", "E")]],
+            [["A", "B"], ["C", ("D", "E")]],
+            [["A", "B"], ["C", ("D", "E")], "M"],
+            ["A", "B", "C", "D", "E", "M"],
+        ),
     ],
 )
 def test_make_phi_list_happy_path(
@@ -944,16 +1284,12 @@ def test_set_bbox_color_happy_path(
     # Arrange
     test_instance = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"))
 
-    mock_convert_dcm_to_png = mocker.patch.object(
-        DicomImageRedactorEngine, "_convert_dcm_to_png", return_value=[None, True]
-    )
-    mock_Image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
-        return_value=None,
+    mock_rescale_dcm_pixel_array = mocker.patch.object(
+        DicomImageRedactorEngine, "_rescale_dcm_pixel_array", return_value=None
     )
-    mock_get_bg_color = mocker.patch.object(
+    mock_get_bg_color_from_array = mocker.patch.object(
         DicomImageRedactorEngine,
-        "_get_bg_color",
+        "_get_bg_color_from_array",
         return_value=mock_box_color,
     )
     mock_engine = DicomImageRedactorEngine()
@@ -962,9 +1298,8 @@ def test_set_bbox_color_happy_path(
     test_box_color = mock_engine._set_bbox_color(test_instance, fill)
 
     # Assert
-    assert mock_convert_dcm_to_png.call_count == 1
-    assert mock_Image_open.call_count == 1
-    assert mock_get_bg_color.call_count == 1
+    assert mock_rescale_dcm_pixel_array.call_count == 1
+    assert mock_get_bg_color_from_array.call_count == 1
     assert test_box_color == mock_box_color
 
 
@@ -1101,6 +1436,105 @@ def test_check_if_has_image_icon_sequence_happy_path(
     # Assert
     assert test_has_sequence == has_sequence
 
+# ------------------------------------------------------
+# DicomImageRedactorEngine._copy_instance_for_redaction()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "dcm_path",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"))
+    ],
+)
+def test_copy_instance_for_redaction_happy_path(
+    mock_engine: DicomImageRedactorEngine,
+    dcm_path: Path,
+):
+    """Test happy path for DicomImageRedactorEngine._copy_instance_for_redaction
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        dcm_path (pathlib.Path): Path to DICOM file.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_path)
+    original_pixel_data = test_instance.PixelData
+    original_pixel_array = test_instance.pixel_array.copy()
+    original_syntax = test_instance.file_meta.TransferSyntaxUID
+    original_photometric = test_instance.PhotometricInterpretation
+    original_planar_configuration = test_instance.get("PlanarConfiguration")
+
+    # Act
+    test_copy = mock_engine._copy_instance_for_redaction(test_instance)
+    test_copy = mock_engine._compress_pixel_data(test_copy)
+    test_copy.PhotometricInterpretation = "YBR_FULL"
+    test_copy.PixelData = b"\x00" * len(original_pixel_data)
+
+    # Assert
+    assert test_copy.PatientName == test_instance.PatientName
+    assert test_instance.PixelData == original_pixel_data
+    assert test_instance.PhotometricInterpretation == original_photometric
+    assert test_instance.file_meta.TransferSyntaxUID == original_syntax
+    assert test_instance.get("PlanarConfiguration") == original_planar_configuration
+    test_instance.convert_pixel_data()
+    assert np.array_equal(test_instance.pixel_array, original_pixel_array)
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._fill_bboxes()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "pixel_shape, dtype, box_color, use_kernel",
+    [
+        ((60, 80), np.uint16, 1023, True),
+        ((60, 80), np.uint16, 1023, False),
+        ((60, 80), np.int16, -5, True),
+        ((60, 80, 3), np.uint8, (10, 20, 30), True),
+        ((60, 80, 3), np.uint8, (10, 20, 30), False),
+        ((60, 80, 3), np.uint8, 255, True),
+        ((4, 60, 80, 3), np.uint8, (10, 20, 30), True),
+        ((4, 60, 80), np.uint16, 1023, True),
+    ],
+)
+def test_fill_bboxes_happy_path(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    pixel_shape: tuple,
+    dtype: type,
+    box_color: Union[int, Tuple[int, int, int]],
+    use_kernel: bool,
+):
+    """Test happy path for DicomImageRedactorEngine._fill_bboxes
+
+    Args:
+        pixel_shape (tuple): Shape of the pixel array.
+        dtype (type): Data type of the pixel array.
+        box_color (int or Tuple of int): Color of the redaction boxes.
+        use_kernel (bool): False to force the NumPy slicing fallback.
+    """
+    # Arrange
+    if use_kernel is False:
+        mocker.patch(
+            "presidio_image_redactor.dicom_image_redactor_engine.njit", None
+        )
+    bboxes = [
+        {"top": 0, "left": 0, "width": 10, "height": 5},
+        {"top": 20, "left": 30, "width": 100, "height": 100},
+        {"top": 40, "left": 5, "width": 0, "height": 10},
+    ]
+    test_pixels = np.zeros(pixel_shape, dtype=dtype)
+    expected_pixels = test_pixels.copy()
+    for bbox in bboxes:
+        expected_pixels[
+            bbox["top"] : bbox["top"] + bbox["height"],
+            bbox["left"] : bbox["left"] + bbox["width"],
+        ] = box_color
+
+    # Act
+    mock_engine._fill_bboxes(test_pixels, bboxes, box_color)
+
+    # Assert
+    assert np.array_equal(test_pixels, expected_pixels)
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._add_redact_box()
 # ------------------------------------------------------
@@ -1244,6 +1678,41 @@ def test_add_redact_box_happy_path(
 
     assert box_color_pixels_redacted > box_color_pixels_original
 
+
+@pytest.mark.parametrize(
+    "dcm_path",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm")),
+    ],
+)
+def test_add_redact_box_no_bboxes(
+    mocker,
+    dcm_path: Path,
+):
+    """Test DicomImageRedactorEngine._add_redact_box without bounding boxes
+
+    Args:
+        dcm_path (pathlib.Path): Path to DICOM file.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_path)
+    mock_check_if_greyscale = mocker.patch.object(
+        DicomImageRedactorEngine,
+        "_check_if_greyscale",
+        return_value=None,
+    )
+    mock_engine = DicomImageRedactorEngine()
+
+    # Act
+    test_redacted_instance = mock_engine._add_redact_box(test_instance, [], 0.75)
+
+    # Assert
+    assert mock_check_if_greyscale.call_count == 0
+    assert test_redacted_instance is not test_instance
+    assert test_redacted_instance.PixelData == test_instance.PixelData
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_analyzer_results()
 # ------------------------------------------------------
@@ -1400,11 +1869,8 @@ def test_DicomImageRedactorEngine_redact_and_return_bbox(
     mock_rescale_dcm = mocker.patch(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._rescale_dcm_pixel_array", return_value=None
     )
-    mock_save_pixel_array = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._save_pixel_array_as_png", return_value=None
-    )
-    mock_image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
+    mock_image_fromarray = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.Image.fromarray",
         return_value=None,
     )
     mock_add_padding = mocker.patch(
@@ -1439,8 +1905,7 @@ def test_DicomImageRedactorEngine_redact_and_return_bbox(
     # assertions for test_bboxes type causes silent failures/hangups for Python 3.11
     mock_check_greyscale.assert_called_once()
     mock_rescale_dcm.assert_called_once()
-    mock_save_pixel_array.assert_called_once()
-    mock_image_open.assert_called_once()
+    mock_image_fromarray.assert_called_once()
     mock_add_padding.assert_called_once()
     mock_analyze.assert_called_once()
     mock_get_analyze_bbox.assert_called_once()
@@ -1597,14 +2062,15 @@ def test_DicomImageRedactorEngine_save_bbox_json_happy_path(
 # DicomImageRedactorEngine _redact_single_dicom_image()
 # ------------------------------------------------------
 @pytest.mark.parametrize(
-    "dcm_path, output_dir, overwrite",
+    "dcm_path, output_dir, overwrite, bboxes",
     [
-        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "output", False),
-        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "output", True),
-        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), "output", False),
-        (Path(TEST_DICOM_DIR_2, "1_ORIGINAL.DCM"), "output", False),
-        (Path(TEST_DICOM_DIR_2, "2_ORIGINAL.dicom"), "output", False),
-        (Path(TEST_DICOM_DIR_3, "3_ORIGINAL.DICOM"), "output", False),
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "output", False, [{}]),
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "output", True, [{}]),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), "output", False, [{}]),
+        (Path(TEST_DICOM_DIR_2, "1_ORIGINAL.DCM"), "output", False, [{}]),
+        (Path(TEST_DICOM_DIR_2, "2_ORIGINAL.dicom"), "output", False, [{}]),
+        (Path(TEST_DICOM_DIR_3, "3_ORIGINAL.DICOM"), "output", False, [{}]),
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "output", False, []),
     ],
 )
 def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
@@ -1613,6 +2079,7 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
     dcm_path: str,
     output_dir: str,
     overwrite: bool,
+    bboxes: list,
 ):
     """Test happy path for DicomImageRedactorEngine _redact_single_dicom_image()
 
@@ -1621,6 +2088,7 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
         dcm_path (str): Path to input DICOM file or dir.
         output_dir (str): Path to parent directory to write output to.
         overwrite (bool): True if overwriting original files.
+        bboxes (list): Bounding boxes found after removing padding.
     """
     # Arrange
     crop_ratio = 0.75
@@ -1628,14 +2096,10 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._copy_files_for_processing",
         return_value=dcm_path,
     )
-    mock_convert_dcm_to_png = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._convert_dcm_to_png",
+    mock_instance_to_pil = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._instance_to_pil",
         return_value=[None, None],
     )
-    mock_image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
-        return_value=None,
-    )
     mock_add_padding = mocker.patch(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._add_padding",
         return_value=None,
@@ -1653,7 +2117,7 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
 
     mock_remove_bbox_padding = mocker.patch(
         "presidio_image_redactor.image_redactor_engine.BboxProcessor.remove_bbox_padding",
-        return_value=None,
+        return_value=bboxes,
     )
 
     class MockInstance:
@@ -1682,13 +2146,150 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
         assert mock_copy_files.call_count == 0
     else:
         assert mock_copy_files.call_count == 1
-    assert mock_convert_dcm_to_png.call_count == 1
-    assert mock_image_open.call_count == 1
+    assert mock_instance_to_pil.call_count == 1
     assert mock_add_padding.call_count == 1
     assert mock_analyze.call_count == 1
     assert mock_get_analyze_bbox.call_count == 1
     assert mock_remove_bbox_padding.call_count == 1
-    assert mock_add_redact_box.call_count == 1
+    assert mock_add_redact_box.call_count == (1 if bboxes else 0)
+
+
+def test_DicomImageRedactorEngine_redact_single_dicom_image_hardlink(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _redact_single_dicom_image() does not write through staged hard links
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    src_path = Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")
+    with open(src_path, "rb") as f:
+        original_bytes = f.read()
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_analyzer_results",
+        return_value=[],
+    )
+    mocker.patch(
+        "presidio_image_redactor.image_redactor_engine.BboxProcessor.remove_bbox_padding",
+        return_value=[{"left": 0, "top": 0, "width": 50, "height": 50}],
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dst_path = mock_engine._copy_files_for_processing(
+            src_path, tmpdirname, hardlink=True
+        )
+
+        # Act
+        mock_engine._redact_single_dicom_image(
+            dcm_path=dst_path,
+            crop_ratio=0.75,
+            fill="contrast",
+            padding_width=25,
+            use_metadata=True,
+            overwrite=True,
+            dst_parent_dir=".",
+            save_bboxes=False,
+            hardlinked=True,
+        )
+
+        # Assert
+        with open(src_path, "rb") as f:
+            assert f.read() == original_bytes
+        with open(dst_path, "rb") as f:
+            assert f.read() != original_bytes
+        assert os.stat(dst_path).st_nlink == 1
+
+
+def test_DicomImageRedactorEngine_redact_single_dicom_image_hardlink_no_bboxes(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _redact_single_dicom_image() unlinks staged files with nothing to redact
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    src_path = Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")
+    with open(src_path, "rb") as f:
+        original_bytes = f.read()
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_analyzer_results",
+        return_value=[],
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dst_path = mock_engine._copy_files_for_processing(
+            src_path, tmpdirname, hardlink=True
+        )
+
+        # Act
+        mock_engine._redact_single_dicom_image(
+            dcm_path=dst_path,
+            crop_ratio=0.75,
+            fill="contrast",
+            padding_width=25,
+            use_metadata=True,
+            overwrite=True,
+            dst_parent_dir=".",
+            save_bboxes=False,
+            hardlinked=True,
+        )
+
+        # Assert
+        assert os.stat(dst_path).st_nlink == 1
+        assert os.listdir(tmpdirname) == ["0_ORIGINAL.dcm"]
+        with open(dst_path, "rb") as f:
+            assert f.read() == original_bytes
+
+
+def test_DicomImageRedactorEngine_redact_single_dicom_image_user_hardlink(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _redact_single_dicom_image() redacts all names of a user's hard linked file
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    src_path = Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")
+    with open(src_path, "rb") as f:
+        original_bytes = f.read()
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_analyzer_results",
+        return_value=[],
+    )
+    mocker.patch(
+        "presidio_image_redactor.image_redactor_engine.BboxProcessor.remove_bbox_padding",
+        return_value=[{"left": 0, "top": 0, "width": 50, "height": 50}],
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dcm_path = Path(tmpdirname, "0_ORIGINAL.dcm")
+        other_path = Path(tmpdirname, "other_name.dcm")
+        with open(dcm_path, "wb") as f:
+            f.write(original_bytes)
+        os.link(dcm_path, other_path)
+
+        # Act
+        mock_engine._redact_single_dicom_image(
+            dcm_path=dcm_path,
+            crop_ratio=0.75,
+            fill="contrast",
+            padding_width=25,
+            use_metadata=True,
+            overwrite=True,
+            dst_parent_dir=".",
+            save_bboxes=False
+        )
+
+        # Assert
+        assert os.path.samefile(dcm_path, other_path)
+        with open(other_path, "rb") as f:
+            assert f.read() != original_bytes
 
 
 @pytest.mark.parametrize(
@@ -1796,6 +2397,138 @@ def test_DicomImageRedactorEngine_redact_multiple_dicom_images_happy_path(
     assert mock_redact_single.call_count == len(mock_dcm_files)
 
 
+@pytest.mark.parametrize(
+    "max_workers",
+    [
+        (2),
+        (None),
+    ],
+)
+def test_DicomImageRedactorEngine_redact_multiple_dicom_images_parallel(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    max_workers: Optional[int],
+):
+    """Test parallel redaction in DicomImageRedactorEngine _redact_multiple_dicom_images()
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        max_workers (int or None): Number of worker processes.
+    """
+    # Arrange
+    mock_dcm_files = [
+        Path("dir1/dir2/file1.dcm"),
+        Path("dir1/dir2/file2.dcm"),
+        Path("dir1/dir2/dir3/file3.dcm"),
+    ]
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_all_dcm_files",
+        return_value=mock_dcm_files,
+    )
+    mock_redact_single = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_single_dicom_image",
+        return_value=None,
+    )
+    mock_executor = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.ProcessPoolExecutor",
+    )
+    mock_map = mock_executor.return_value.__enter__.return_value.map
+    mock_map.return_value = []
+
+    # Act
+    mock_engine._redact_multiple_dicom_images(
+        dcm_dir=Path(TEST_DICOM_DIR_2),
+        crop_ratio=0.75,
+        fill="contrast",
+        padding_width=25,
+        use_metadata=True,
+        overwrite=True,
+        dst_parent_dir="output",
+        save_bboxes=False,
+        max_workers=max_workers,
+    )
+
+    # Assert
+    assert mock_executor.call_count == 1
+    assert mock_map.call_count == 1
+    assert list(mock_map.call_args[0][1]) == mock_dcm_files
+    assert mock_redact_single.call_count == 0
+    redact_single_dicom_image = mock_executor.call_args.kwargs["initargs"][0]
+    assert redact_single_dicom_image.func == mock_redact_single
+    assert redact_single_dicom_image.keywords["overwrite"] is True
+
+
+@pytest.mark.parametrize(
+    "max_workers",
+    [
+        (0),
+        (-1),
+    ],
+)
+def test_DicomImageRedactorEngine_redact_multiple_dicom_images_max_workers_exceptions(
+    mock_engine: DicomImageRedactorEngine,
+    max_workers: int,
+):
+    """Test error handling of max_workers in _redact_multiple_dicom_images()
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        max_workers (int): Number of worker processes.
+    """
+    with pytest.raises(Exception) as exc_info:
+        # Act
+        mock_engine._redact_multiple_dicom_images(
+            dcm_dir=Path(TEST_DICOM_DIR_2),
+            crop_ratio=0.75,
+            fill="contrast",
+            padding_width=25,
+            use_metadata=True,
+            overwrite=True,
+            dst_parent_dir="output",
+            save_bboxes=False,
+            max_workers=max_workers,
+        )
+
+    # Assert
+    assert exc_info.typename == "ValueError"
+
+
+def test_DicomImageRedactorEngine_redact_from_directory_process_pool():
+    """Test parallel redaction in worker processes (no mocked executor)"""
+    # Arrange
+    test_engine = StubAnalysisDicomImageRedactorEngine()
+    ad_hoc_recognizer = PatternRecognizer(
+        supported_entity="PERSON",
+        patterns=[Pattern(name="person", regex="DAVIDSON", score=0.9)],
+    )
+    src_files = test_engine._get_all_dcm_files(Path(TEST_DICOM_DIR_2))
+    original_bytes = {}
+    for src_file in src_files:
+        with open(src_file, "rb") as f:
+            original_bytes[src_file.name] = f.read()
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Act
+        test_engine.redact_from_directory(
+            input_dicom_path=str(TEST_DICOM_DIR_2),
+            output_dir=tmpdirname,
+            ad_hoc_recognizers=[ad_hoc_recognizer],
+            max_workers=2,
+            score_threshold=0.5,
+        )
+
+        # Assert
+        output_files = test_engine._get_all_dcm_files(Path(tmpdirname))
+        assert len(output_files) == len(src_files)
+        for output_file in output_files:
+            with open(output_file, "rb") as f:
+                assert f.read() != original_bytes[output_file.name]
+            assert os.stat(output_file).st_nlink == 1
+        for src_file in src_files:
+            with open(src_file, "rb") as f:
+                assert f.read() == original_bytes[src_file.name]
+
+
 @pytest.mark.parametrize(
     "dcm_path, expected_error_type",
     [
@@ -1972,17 +2705,19 @@ def test_DicomImageRedactorEngine_redact_from_directory_happy_path(
 
 
 @pytest.mark.parametrize(
-    "input_path, output_path, expected_error_type",
+    "input_path, output_path, max_workers, expected_error_type",
     [
-        (f"{TEST_DICOM_PARENT_DIR}/0_ORIGINAL.dcm", "output", "TypeError"),
-        (TEST_DICOM_DIR_1, f"{TEST_DICOM_PARENT_DIR}/0_ORIGINAL.dcm", "TypeError"),
-        ("nonexistentdir", "output", "TypeError"),
+        (f"{TEST_DICOM_PARENT_DIR}/0_ORIGINAL.dcm", "output", 1, "TypeError"),
+        (TEST_DICOM_DIR_1, f"{TEST_DICOM_PARENT_DIR}/0_ORIGINAL.dcm", 1, "TypeError"),
+        ("nonexistentdir", "output", 1, "TypeError"),
+        (TEST_DICOM_DIR_1, "output", 0, "ValueError"),
     ],
 )
 def test_DicomImageRedactorEngine_redact_from_directory_exceptions(
     mock_engine: DicomImageRedactorEngine,
     input_path: str,
     output_path: Path,
+    max_workers: int,
     expected_error_type: str,
 ):
     """Test error handling of DicomImageRedactorEngine redact_from_directory()
@@ -1991,11 +2726,12 @@ def test_DicomImageRedactorEngine_redact_from_directory_exceptions(
         mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
         input_path (str): Path to input DICOM file or dir.
         output_path (pathlib.Path): Path to DICOM dir or file.
+        max_workers (int): Number of worker processes.
         expected_error_type (str): Type of error we expect to be raised.
     """
     with pytest.raises(Exception) as exc_info:
         # Act
-        mock_engine.redact_from_directory(input_path, output_path, padding_width=25, fill="contrast", use_metadata=True)
+        mock_engine.redact_from_directory(input_path, output_path, padding_width=25, fill="contrast", use_metadata=True, max_workers=max_workers)
 
     # Assert
     assert expected_error_type == exc_info.typename